@@ -0,0 +1,100 @@
+"""
+Ink latency benchmark. A fake pen draws circles through the pen input API at a fixed rate while
+the drawn ink tip is compared with the true pen position. Reports how far, in ms, the ink lags
+behind the pen, with and without predictive ink.
+
+Usage: python bench_latency.py [--rate HZ] [--seconds S]
+"""
+from typing import List
+
+import argparse
+import math
+import statistics
+import threading
+import time
+
+from sdcanvas.mixins.pen import PEN_DOWN, PEN_MOVE, PEN_UP, PenSample
+from sdwindow import SDWindow
+
+CENTER = 200, 200
+RADIUS = 100
+SPEED = 2 * math.pi     # rad/s, one circle per second
+
+def pen_position(t: float):
+    "True pen position t seconds after the stroke started."
+    a = SPEED * t
+    return CENTER[0] + RADIUS * math.cos(a), CENTER[1] + RADIUS * math.sin(a)
+
+def run(sd: SDWindow, predictive: bool, rate: float, seconds: float) -> List[float]:
+    "Draw one long stroke and return the measured ink lag samples, in ms."
+    canvas = sd.canvas
+    canvas.predictive_ink = predictive
+    lags: List[float] = []
+    done = False
+    t0 = time.perf_counter()
+
+    def pen():
+        n = int(rate * seconds)
+        for i in range(n + 1):
+            t = t0 + i / rate
+            time.sleep(max(t - time.perf_counter(), 0))
+            kind = PEN_DOWN if i == 0 else PEN_UP if i == n else PEN_MOVE
+            canvas.submit_pen_samples([PenSample(kind, t, *pen_position(t - t0))])
+
+    def measure():
+        nonlocal done
+        if done:
+            return
+        now = time.perf_counter()
+        if now - t0 > seconds:
+            done = True
+            sd.quit()
+            return
+        tip = canvas.ink_tip
+        if tip is not None:
+            # Angle between the drawn tip and the true pen position, converted to time
+            x, y = tip[0] - canvas.canvasx(0), tip[1] - canvas.canvasy(0)
+            a_tip = math.atan2(y - CENTER[1], x - CENTER[0])
+            a_pen = SPEED * (now - t0)
+            diff = (a_pen - a_tip + math.pi) % (2 * math.pi) - math.pi
+            lags.append(diff / SPEED * 1000)
+        # Measure right after the next redraw
+        sd.after(5, lambda: sd.after_idle(measure))
+
+    thread = threading.Thread(target=pen, daemon=True)
+    thread.start()
+    sd.after(5, measure)
+    sd.mainloop()
+
+    # Let the stroke finish before the next run
+    thread.join()
+    while canvas.pen_stats.queued:
+        sd.update()
+        time.sleep(0.005)
+    return lags
+
+def main() -> None:
+    "Run the benchmark with and without predictive ink and print the results."
+    parser = argparse.ArgumentParser(description='ScoreDraft ink latency benchmark')
+    parser.add_argument('--rate', type=float, default=240, help='pen samples per second')
+    parser.add_argument('--seconds', type=float, default=5, help='duration of each run')
+    args = parser.parse_args()
+
+    sd = SDWindow()
+    sd.canvas.start_pen_input()
+    sd.update()
+
+    for predictive in (False, True):
+        lags = run(sd, predictive, args.rate, args.seconds)
+        if len(lags) < 2:
+            print("not enough samples")
+            continue
+        p95 = statistics.quantiles([abs(lag) for lag in lags], n=20)[-1]
+        print(
+            f"predictive ink {'on ' if predictive else 'off'}: "
+            f"mean lag {statistics.mean(lags):6.1f} ms, p95 |lag| {p95:6.1f} ms"
+        )
+    sd.destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Pan and redraw benchmark. Opens synthetic documents of growing size and sweeps the view across
+them, reporting how long each pan frame takes to redraw, with and without the raster cache.
+With the raster cache on, frame time should stay roughly constant as documents grow.
+
+Usage: python bench_redraw.py [--items N [N ...]] [--frames F] [--raster-cache | --no-raster-cache]
+Without a --raster-cache option, every document is measured both with and without the cache.
+"""
+from typing import List
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from bench_startup import write_synthetic_document
+from sdwindow import SDWindow
+
+DOCUMENT_SIZE = 4000
+PAN_STEP = 20       # px per frame
+ROW_STEP = 300      # px down after each row of the sweep
+
+def wait_until_ready(sd: SDWindow) -> None:
+    "Run Tk until the document is loaded and, if the raster cache is on, fully baked."
+    canvas = sd.canvas
+    ready = False
+
+    def on_ready(_event):
+        nonlocal ready
+        ready = True
+
+    canvas.bind('<<Ready>>', on_ready, add=True)
+    while not ready or canvas.has_pending_bakes:
+        sd.update()
+        time.sleep(0.001)
+
+def sweep(sd: SDWindow, frames: int) -> List[float]:
+    "Pan across the document row by row and return the time of each frame, in ms."
+    canvas = sd.canvas
+    times: List[float] = []
+    direction = 1
+    x = 0
+    for _ in range(frames):
+        if not 0 <= x + direction * PAN_STEP <= DOCUMENT_SIZE - canvas.view_w:
+            direction = -direction
+            dx, dy = 0, ROW_STEP
+        else:
+            dx, dy = direction * PAN_STEP, 0
+        x += dx
+
+        start = time.perf_counter()
+        canvas.pan(dx, dy)
+        canvas.flush_pan()
+        sd.update_idletasks()
+        times.append((time.perf_counter() - start) * 1000)
+        sd.update()
+    return times
+
+def run(document: str, raster_cache: bool, frames: int) -> List[float]:
+    "Open the document and return the pan frame times."
+    sd = SDWindow(document, raster_cache=raster_cache)
+    sd.canvas.kinetic_pan = False
+    wait_until_ready(sd)
+    times = sweep(sd, frames)
+    sd.destroy()
+    return times
+
+def main() -> None:
+    "Run the benchmark and print the results."
+    parser = argparse.ArgumentParser(description='ScoreDraft pan and redraw benchmark')
+    parser.add_argument(
+        '--items', type=int, nargs='+', default=[1000, 5000, 20000],
+        help='strokes in each synthetic document',
+    )
+    parser.add_argument('--frames', type=int, default=300, help='pan frames per run')
+    parser.add_argument(
+        '--raster-cache', action=argparse.BooleanOptionalAction,
+        help='only measure with (or without) the raster cache',
+    )
+    args = parser.parse_args()
+    modes = [args.raster_cache] if args.raster_cache is not None else [False, True]
+
+    print(f"{'items':>7} {'raster cache':>13} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for items in args.items:
+        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
+            document = f.name
+        try:
+            write_synthetic_document(document, items, DOCUMENT_SIZE)
+            for raster_cache in modes:
+                times = run(document, raster_cache, args.frames)
+                p95 = statistics.quantiles(times, n=20)[-1]
+                print(
+                    f"{items:>7} {'on' if raster_cache else 'off':>13} "
+                    f"{statistics.mean(times):>9.3f} {p95:>9.3f} {max(times):>9.3f}"
+                )
+        finally:
+            os.remove(document)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Startup benchmark. Reports time to first frame (canvas first drawn) and time to interactive
+(background set up and document fully loaded), both measured from before importing ScoreDraft.
+
+Usage: python bench_startup.py [document.svg] [--items N] [--raster-cache]
+Without a document, a synthetic one with N random strokes is generated.
+"""
+import time
+T0 = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+from typing import Dict
+
+import argparse
+import os
+import random
+import tempfile
+
+def write_synthetic_document(file: str, items: int, size: int=4000, seed: int=0) -> None:
+    """Write an svg document with random walk polylines, as saved by ScoreDraft."""
+    rnd = random.Random(seed)
+    lines = []
+    for _ in range(items):
+        x, y = rnd.uniform(0, size), rnd.uniform(0, size)
+        points = []
+        for _ in range(rnd.randint(10, 60)):
+            x += rnd.uniform(-4, 4)
+            y += rnd.uniform(-4, 4)
+            points += [f'{x:.1f}', f'{y:.1f}']
+        lines.append(f'<polyline points="{" ".join(points)}"/>')
+
+    with open(file, 'w', encoding='utf-8') as f:
+        f.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}">'
+            + ''.join(lines) + '</svg>'
+        )
+
+def main() -> None:
+    "Run the benchmark and print the results."
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('document', nargs='?', help='svg document to open')
+    parser.add_argument('--items', type=int, default=5000, help='strokes in synthetic document')
+    parser.add_argument('--raster-cache', action='store_true', help='bake strokes into layers')
+    args = parser.parse_args()
+
+    tmp = None
+    document = args.document
+    if document is None:
+        with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as f:
+            tmp = document = f.name
+        write_synthetic_document(document, args.items)
+
+    t_gen = time.perf_counter()
+    from sdwindow import SDWindow  # pylint: disable=import-outside-toplevel
+    t_import = time.perf_counter()
+
+    times: Dict[str, float] = {}
+    sd = SDWindow(document, raster_cache=args.raster_cache)
+    canvas = sd.canvas
+
+    def on_first_frame(_event):
+        times['first_frame'] = time.perf_counter()
+
+    def on_ready(_event):
+        times['interactive'] = time.perf_counter()
+        sd.after_idle(sd.destroy)
+
+    canvas.bind('<<FirstFrame>>', on_first_frame, add=True)
+    canvas.bind('<<Ready>>', on_ready, add=True)
+    sd.mainloop()
+
+    if tmp is not None:
+        os.remove(tmp)
+
+    # Document generation is not part of startup
+    offset = t_gen - T0
+    print(f"import:              {(t_import - T0 - offset) * 1000:8.1f} ms")
+    print(f"time to first frame: {(times['first_frame'] - T0 - offset) * 1000:8.1f} ms")
+    print(f"time to interactive: {(times['interactive'] - T0 - offset) * 1000:8.1f} ms")
+    print(f"items loaded:        {len(canvas.items):8d}")
+
+if __name__ == "__main__":
+    main()
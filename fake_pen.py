@@ -0,0 +1,65 @@
+"""
+Fake pen for load testing pen input. Connects to a ScoreDraft pen server and draws spirals at a
+fixed sample rate, then reports how many samples were sent.
+
+Usage: python sdwindow.py --pen-port 7777 & python fake_pen.py 7777 [--rate HZ] [--seconds S]
+"""
+import argparse
+import math
+import socket
+import time
+
+from sdcanvas.mixins.pen import PEN_DOWN, PEN_MOVE, PEN_UP, PenSample, encode_pen_samples
+
+def strokes(rate: float, seconds: float, stroke_samples: int=240):
+    """Yield pen samples for spiral strokes, timestamped as if sampled at the given rate."""
+    t0 = time.perf_counter()
+    total = int(rate * seconds)
+    for i in range(total):
+        t = t0 + i / rate
+        j = i % stroke_samples
+        stroke = i // stroke_samples
+        cx, cy = 100 + stroke % 5 * 120, 100 + stroke // 5 % 4 * 120
+        a = j / stroke_samples * 6 * math.pi
+        x, y = cx + math.cos(a) * j / 5, cy + math.sin(a) * j / 5
+        if j == 0:
+            kind = PEN_DOWN
+        elif j == stroke_samples - 1 or i == total - 1:
+            kind = PEN_UP
+        else:
+            kind = PEN_MOVE
+        yield PenSample(kind, t, x, y)
+
+def main() -> None:
+    "Send samples in real time, one packet per sample, and print a summary."
+    parser = argparse.ArgumentParser(description='ScoreDraft fake pen')
+    parser.add_argument('port', type=int, help='pen server port')
+    parser.add_argument('--host', default='127.0.0.1', help='pen server host')
+    parser.add_argument('--rate', type=float, default=240, help='samples per second')
+    parser.add_argument('--seconds', type=float, default=10, help='duration of the test')
+    args = parser.parse_args()
+
+    sent = 0
+    late = 0
+    blocked = 0.0
+    with socket.create_connection((args.host, args.port)) as conn:
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for sample in strokes(args.rate, args.seconds):
+            wait = sample.time - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            else:
+                late += 1
+            # sendall blocks when ScoreDraft applies backpressure
+            t = time.perf_counter()
+            conn.sendall(encode_pen_samples([sample]))
+            blocked += time.perf_counter() - t
+            sent += 1
+
+    print(
+        f"sent {sent} samples at {args.rate:g} Hz ({late} behind schedule, "
+        f"{blocked * 1000:.1f} ms blocked sending)"
+    )
+
+if __name__ == "__main__":
+    main()
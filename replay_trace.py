@@ -0,0 +1,142 @@
+"""
+Replay an input trace recorded with `sdwindow.py --record` and report per-event latency, the
+final document hash and memory growth. Meant to run headless for regression testing:
+
+Usage: xvfb-run python replay_trace.py TRACE [--realtime]
+
+By default events are replayed as fast as possible, --realtime keeps the original timing.
+The canvas size, document, raster cache and predictive ink settings are taken from the trace.
+Kinetic panning depends on wall clock time, so it is disabled to keep replays deterministic and
+the view movement it caused while recording is replayed instead.
+Key events have their usual effects, e.g. saving and loading test.svg in the working directory.
+"""
+from typing import Any, Dict, List, Tuple
+
+import argparse
+import hashlib
+import os
+import statistics
+import time
+import tkinter as tk
+
+from sdcanvas import SDCanvas
+from sdcanvas.trace import TraceBatch, TraceItem, read_trace
+
+def get_rss_kb() -> int:
+    "Current resident memory of the process in KiB, or peak resident memory if not available."
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        import resource  # pylint: disable=import-outside-toplevel
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def document_hash(canvas: SDCanvas) -> str:
+    "Hash of the type and coordinates of every committed item, in order."
+    h = hashlib.sha256()
+    for item_id in canvas.items:
+        coords = ' '.join(f'{c:.1f}' for c in canvas.coords(item_id))
+        h.update(f'{canvas.type(item_id)} {coords}\n'.encode())
+    return h.hexdigest()
+
+def dispatch(root: tk.Tk, canvas: SDCanvas, event: TraceItem) -> None:
+    "Feed an event to the canvas the same way Tk or the pen input would."
+    if isinstance(event, TraceBatch):
+        canvas._on_rmb_drag_batch(event.events)  # pylint: disable=protected-access
+        return
+    if event.kind == 'pan':
+        canvas.pan(event.x, event.y)
+        canvas.flush_pan()
+        return
+    if event.kind == 'configure':
+        # Resize for real so every <Configure> binding runs
+        root.geometry(f'{event.width}x{event.height}')
+        root.update_idletasks()
+        return
+    getattr(canvas, f'_on_{event.kind}')(event)
+
+def open_canvas(header: Dict[str, Any]) -> Tuple[tk.Tk, SDCanvas]:
+    "Create a canvas set up like the recorded one and wait until it is ready."
+    root = tk.Tk()
+    root.geometry(f"{header['width']}x{header['height']}")
+    canvas = SDCanvas(
+        root, raster_cache=header['raster_cache'], document=header['document'],
+        scrollregion=(0, 0, 400, 400),
+    )
+    canvas.kinetic_pan = False
+    canvas.predictive_ink = header['predictive_ink']
+    canvas.pack(fill='both', expand=True)
+
+    ready = False
+    def on_ready(_event):
+        nonlocal ready
+        ready = True
+    canvas.bind('<<Ready>>', on_ready, add=True)
+    while not ready:
+        root.update()
+    return root, canvas
+
+def run_events(
+    root: tk.Tk, canvas: SDCanvas, events: List[TraceItem], realtime: bool
+) -> Dict[str, List[float]]:
+    "Dispatch the events and return the latencies of each kind, in ms."
+    latencies: Dict[str, List[float]] = {}
+    t0 = time.perf_counter()
+    for event in events:
+        if realtime:
+            # Keep Tk running while waiting for the event's original time
+            while (wait := event.t / 1000 - (time.perf_counter() - t0)) > 0:
+                root.update()
+                time.sleep(min(wait, 0.001))
+
+        start = time.perf_counter()
+        dispatch(root, canvas, event)
+        root.update_idletasks()
+        latencies.setdefault(event.kind, []).append((time.perf_counter() - start) * 1000)
+        root.update()
+    return latencies
+
+def print_latencies(latencies: Dict[str, List[float]]) -> None:
+    "Print a latency table, one row per event kind."
+    print(f"{'kind':<14} {'count':>7} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for kind, values in sorted(latencies.items()):
+        p95 = statistics.quantiles(values, n=20)[-1] if len(values) >= 2 else values[0]
+        print(
+            f"{kind:<14} {len(values):>7} {statistics.mean(values):>9.3f} "
+            f"{p95:>9.3f} {max(values):>9.3f}"
+        )
+
+def replay(file: str, realtime: bool) -> None:
+    "Replay a trace and print the report."
+    header, events, dropped = read_trace(file)
+    if dropped:
+        print(f"warning:      trace was cut short, {dropped} incomplete events dropped")
+    root, canvas = open_canvas(header)
+
+    rss_start = get_rss_kb()
+    t0 = time.perf_counter()
+    latencies = run_events(root, canvas, events, realtime)
+    total = time.perf_counter() - t0
+    canvas.flush_pan()
+    root.update()
+    rss_end = get_rss_kb()
+    items = len(canvas.items)
+    doc_hash = document_hash(canvas)
+    root.destroy()
+
+    print(f"events:       {len(events)} in {total:.2f} s ({'realtime' if realtime else 'fast'})")
+    print_latencies(latencies)
+    print(f"items:        {items}")
+    print(f"document:     {doc_hash}")
+    print(f"memory:       {rss_start} KiB -> {rss_end} KiB ({rss_end - rss_start:+d} KiB)")
+
+def main() -> None:
+    "Parse arguments and replay."
+    parser = argparse.ArgumentParser(description='ScoreDraft trace replay')
+    parser.add_argument('trace', help='trace file recorded with sdwindow.py --record')
+    parser.add_argument('--realtime', action='store_true', help='keep the original timing')
+    args = parser.parse_args()
+    replay(args.trace, args.realtime)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from .area import AreaMixin
 from .bg import BGMixin
 from .draw import DrawMixin
+from .pen import PenInputMixin
+from .raster import RasterMixin
 from .svg import SVGMixin
 from .view import ViewMixin
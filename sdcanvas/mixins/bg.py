@@ -1,18 +1,20 @@
 """
 Memory efficient tiling background on infinite canvas for the SDCanvas class.
 """
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from typing import Optional, Tuple
 
 import tkinter as tk
 
-import PIL.Image
-from PIL import UnidentifiedImageError
-from PIL.Image import Image as PILImage
-from PIL.ImageTk import PhotoImage as PILPhotoImage
-from PIL.ImageFile import ImageFile as PILImageFile
-
 from sdcanvas.mixins.view import ViewMixin
 
+# PIL is imported on first use to keep startup fast
+if TYPE_CHECKING:
+    from PIL.Image import Image as PILImage
+    from PIL.ImageTk import PhotoImage as PILPhotoImage
+    from PIL.ImageFile import ImageFile as PILImageFile
+
 class BGMixin(ViewMixin, tk.Canvas):
     """Adds a tiling background to an infinite canvas. Requires hooking the provided methods."""
     TAG = 'background'
@@ -21,6 +23,7 @@ class BGMixin(ViewMixin, tk.Canvas):
     _tile: Optional[PILImageFile] = None
     _bg_img: Optional[PILImage] = None
     _bg_photoimg: Optional[PILPhotoImage] = None
+    _bg_position: Tuple[float, float] = 0, 0
 
     @property
     def has_background(self):
@@ -34,6 +37,8 @@ class BGMixin(ViewMixin, tk.Canvas):
 
     def set_background_tile(self, file: str):
         """Add a background to the canvas from a tiling image."""
+        import PIL.Image
+        from PIL import UnidentifiedImageError
 
         # Attempt to load image
         try:
@@ -48,7 +53,8 @@ class BGMixin(ViewMixin, tk.Canvas):
         # Create new background
         self._tile = tile
         self._configure_bind_id = self.bind('<Configure>', self._on_configure, add=True)
-        self.create_image(*self.view_position, image=None, anchor='nw', tags=self.TAG)
+        self._bg_position = self.view_position
+        self.create_image(*self._bg_position, image=None, anchor='nw', tags=self.TAG)
         self._resize_background(self.view_w, self.view_h)
 
     def clear_background(self) -> None:
@@ -62,19 +68,10 @@ class BGMixin(ViewMixin, tk.Canvas):
         self._bg_photoimg = None
         self.delete(self.TAG)
 
-    def xview(self, *args):
-        """Update background to be into view"""
-        out = super().xview(*args)
-        if len(args) >= 2:
-            self._scroll_background()
-        return out
-
-    def yview(self, *args):
+    def _on_view_changed(self) -> None:
         """Update background to be into view"""
-        out = super().yview(*args)
-        if len(args) >= 2:
-            self._scroll_background()
-        return out
+        super()._on_view_changed()
+        self._scroll_background()
 
     def _on_configure(self, event):
         """Hook for canvas configure event. Updates background to fill window"""
@@ -117,6 +114,9 @@ class BGMixin(ViewMixin, tk.Canvas):
         if w <= self.background_w and h <= self.background_h:
             return
 
+        import PIL.Image
+        from PIL.ImageTk import PhotoImage as PILPhotoImage
+
         # Adjust w and h to be multiples of tile size
         w = w - w % self.tile_w + 2 * self.tile_w
         h = h - h % self.tile_h + 2 * self.tile_h
@@ -143,7 +143,10 @@ class BGMixin(ViewMixin, tk.Canvas):
         if self._tile is None:
             return
 
-        bg_x, bg_y = self.coords(self.TAG)
         bg_x = self.view_x // self.tile_w * self.tile_w
         bg_y = self.view_y // self.tile_h * self.tile_h
+        if (bg_x, bg_y) == self._bg_position:
+            return
+
+        self._bg_position = bg_x, bg_y
         self.coords(self.TAG, bg_x, bg_y)
@@ -1,8 +1,10 @@
 """
 Draw methods for the SDCanvas class.
 """
-from typing import List
+from typing import Deque, List, Optional, Sequence, Tuple
 
+from collections import deque
+from math import hypot
 import tkinter as tk
 
 from sdcanvas import STYLES
@@ -11,49 +13,172 @@ from sdcanvas.mixins import AreaMixin
 class DrawMixin(AreaMixin, tk.Canvas):
     """Collection of draw methods for the SDCanvas class."""
 
+    PREDICTION_HORIZON = 16     # ms of ink extrapolated ahead of the last point
+    PREDICTION_WINDOW = 24      # ms of recent points used to estimate velocity and acceleration
+    PREDICTION_MIN_SPAN = 8     # ms, shorter spans are too noisy to estimate from
+    PREDICTION_MAX_RATIO = 2    # max predicted distance, relative to constant velocity prediction
+
     items: List[int] = []
+    predictive_ink: bool = False
 
     _active_line_id: int | None = None
+    _tail_line_id: int | None = None
+    _tail_collapse_id: str | None = None
+    _ink_history: Deque[Tuple[float, float, float]] = deque()   # (time, x, y)
+
+    @property
+    def ink_tip(self) -> Optional[Tuple[float, float]]:
+        """End point of the line being drawn, including the predicted tail, or None."""
+        line_id = self._tail_line_id or self._active_line_id
+        if line_id is None:
+            return None
+        coords = self.coords(line_id)
+        return coords[-2], coords[-1]
 
     def draw_point(self, cx: float, cy: float, cr: float=2) -> None:
         """Draw a point following style guidelines."""
 
         x1, y1, x2, y2 = cx - cr, cy - cr, cx + cr, cy + cr
         oval_id = self.create_oval(x1, y1, x2, y2, **STYLES.OVAL)
-        self.update_active_area_from_item(oval_id)
-        self.items.append(oval_id)
+        self._commit_item(oval_id)
 
     def draw_line(self, x1: float, y1: float, x2: float, y2: float, *args: float) -> None:
         """Create a line with all given points, following style guidelines."""
         line_id = self.create_line(x1, y1, x2, y2, *args, **STYLES.LINE)
-        self.update_active_area_from_item(line_id)
-        self.items.append(line_id)
+        self._commit_item(line_id)
 
-    def start_line(self, x1: float, y1: float, x2: float, y2: float) -> None:
-        """Initialize line segment, following style guidelines."""
+    def start_line(
+        self, x1: float, y1: float, x2: float, y2: float, time: Optional[float]=None
+    ) -> None:
+        """
+        Initialize line segment, following style guidelines.
+        Time (ms) of the last point is used to predict the line, if predictive ink is on.
+        """
 
         if self._active_line_id is not None:
             return
 
         self._active_line_id = self.create_line(x1, y1, x2, y2, **STYLES.LINE)
-
-    def extend_line(self, *coords: float) -> None:
-        """Add a segment to current line."""
+        self._ink_history = deque()
+        self._predict_line([] if time is None else [(time, x2, y2)])
+
+    def extend_line(
+        self,
+        *coords: float,
+        time: Optional[float]=None,
+        times: Optional[Sequence[float]]=None,
+    ) -> None:
+        """
+        Add a segment to current line.
+        Time (ms) of the last point, or times of every point, are used to predict the line,
+        if predictive ink is on.
+        """
 
         if self._active_line_id is None:
             return
 
         line_id = self._active_line_id
         self.coords(line_id, *self.coords(line_id), *coords)
+        if times is not None:
+            self._predict_line(list(zip(times, coords[::2], coords[1::2])))
+        else:
+            self._predict_line([] if time is None else [(time, coords[-2], coords[-1])])
 
     def end_line(self) -> None:
-        """Finish drawing line, adding it to canvas items"""
+        """Finish drawing line, adding it to canvas items. The predicted tail is discarded."""
         if self._active_line_id is None:
             return
 
-        self.update_active_area_from_item(self._active_line_id)
-        self.items.append(self._active_line_id)
+        if self._tail_collapse_id is not None:
+            self.after_cancel(self._tail_collapse_id)
+            self._tail_collapse_id = None
+        if self._tail_line_id is not None:
+            self.delete(self._tail_line_id)
+            self._tail_line_id = None
+
+        line_id = self._active_line_id
         self._active_line_id = None
+        self._commit_item(line_id)
+
+    def _predict_line(self, points: Sequence[Tuple[float, float, float]]) -> None:
+        """
+        Add (time, x, y) points to the history and draw a provisional tail from the last one
+        to where the line is expected to be.
+        """
+        if not self.predictive_ink or not points:
+            return
+
+        history = self._ink_history
+        for point in points:
+            if history and point[0] <= history[-1][0]:
+                # Same timestamp, e.g. coarse Tk event times: keep the newest
+                history.pop()
+            history.append(point)
+        time, x, y = points[-1]
+        # Keep the newest point at or before the start of the window, so it is fully covered
+        while len(history) > 1 and history[1][0] <= time - self.PREDICTION_WINDOW:
+            history.popleft()
+
+        dx, dy = self._estimate_tail()
+        if self._tail_line_id is None:
+            self._tail_line_id = self.create_line(x, y, x + dx, y + dy, **STYLES.LINE)
+        else:
+            self.coords(self._tail_line_id, x, y, x + dx, y + dy)
+
+        # Pull the tail back if no new points arrive, e.g. the pen stopped
+        if self._tail_collapse_id is not None:
+            self.after_cancel(self._tail_collapse_id)
+        self._tail_collapse_id = self.after(2 * self.PREDICTION_HORIZON, self._collapse_tail, x, y)
+
+    def _estimate_tail(self) -> Tuple[float, float]:
+        """Offset from the last point to the point expected PREDICTION_HORIZON ms later."""
+        motion = self._estimate_motion()
+        if motion is None:
+            return 0, 0
+
+        vx, vy, ax, ay = motion
+        h = self.PREDICTION_HORIZON
+        dx = vx * h + ax * h * h / 2
+        dy = vy * h + ay * h * h / 2
+
+        # Limit overshoot caused by acceleration
+        limit = hypot(vx, vy) * h * self.PREDICTION_MAX_RATIO
+        dist = hypot(dx, dy)
+        if dist > limit:
+            return (dx * limit / dist, dy * limit / dist) if limit > 0 else (0, 0)
+        return dx, dy
+
+    def _estimate_motion(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Velocity at the last point and acceleration (vx, vy, ax, ay) of the line, or None if there
+        is too little history. Velocity is measured over the whole window and acceleration from
+        the velocities of each half, so single noisy points matter less.
+        """
+        history = self._ink_history
+        p0, p2 = history[0], history[-1]
+        if p2[0] - p0[0] < self.PREDICTION_MIN_SPAN:
+            return None
+
+        vx, vy = _velocity(p0, p2)
+        p1 = min(history, key=lambda p: abs(p[0] - (p0[0] + p2[0]) / 2))
+        if min(p1[0] - p0[0], p2[0] - p1[0]) < self.PREDICTION_MIN_SPAN / 2:
+            return vx, vy, 0, 0
+
+        (vx1, vy1), (vx2, vy2) = _velocity(p0, p1), _velocity(p1, p2)
+        half = (p2[0] - p0[0]) / 2
+        ax, ay = (vx2 - vx1) / half, (vy2 - vy1) / half
+        # The mean velocity is the velocity at the middle of the window, move it to the end
+        return vx + ax * half, vy + ay * half, ax, ay
+
+    def _collapse_tail(self, x: float, y: float) -> None:
+        self._tail_collapse_id = None
+        if self._tail_line_id is not None:
+            self.coords(self._tail_line_id, x, y, x, y)
+
+    def _commit_item(self, item_id: int) -> None:
+        """Add a finished item to canvas items. Hook for mixins that track committed items."""
+        self.update_active_area_from_item(item_id)
+        self.items.append(item_id)
 
     def remove_last_item(self):
         """Remove the last created item from the canvas."""
@@ -61,3 +186,10 @@ class DrawMixin(AreaMixin, tk.Canvas):
             self.delete(self.items.pop())
         except IndexError:
             pass
+
+def _velocity(
+    p: Tuple[float, float, float], q: Tuple[float, float, float]
+) -> Tuple[float, float]:
+    """Velocity between two (time, x, y) points."""
+    dt = q[0] - p[0]
+    return (q[1] - p[1]) / dt, (q[2] - p[2]) / dt
@@ -0,0 +1,197 @@
+"""
+Thread-safe pen input ingestion for the SDCanvas class.
+"""
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional
+
+from collections import deque
+import socket
+import struct
+import threading
+import time
+import tkinter as tk
+
+PEN_DOWN = 0
+PEN_MOVE = 1
+PEN_UP = 2
+
+# Wire format of a sample sent to the pen server: kind, time, x, y
+PEN_SAMPLE_STRUCT = struct.Struct('<Bdff')
+
+class PenSample(NamedTuple):
+    """A pen sample. Time is in seconds, x and y are window coordinates like in Tk events."""
+    kind: int
+    time: float
+    x: float
+    y: float
+
+class PenEvent(NamedTuple):
+    """Stand-in for the tk.Event fields used by SDCanvas states."""
+    x: int
+    y: int
+    time: float     # ms, fractional to keep sub-ms precision for high-rate pens
+
+class PenStats(NamedTuple):
+    """Pen input counters."""
+    received: int   # samples submitted
+    dropped: int    # samples rejected because the queue was full
+    drained: int    # samples fed to the state machine
+    queued: int     # samples waiting to be drained
+    frames: int     # frames that drained at least one sample
+
+def encode_pen_samples(samples: Iterable[PenSample]) -> bytes:
+    """Encode samples in the pen server wire format."""
+    return b''.join(PEN_SAMPLE_STRUCT.pack(*s) for s in samples)
+
+def decode_pen_samples(data: bytes) -> Iterator[PenSample]:
+    """Decode samples in the pen server wire format. Data length must be a multiple of the size."""
+    return (PenSample(*s) for s in PEN_SAMPLE_STRUCT.iter_unpack(data))
+
+class PenInputMixin(tk.Canvas):  # pylint: disable=too-many-instance-attributes
+    """
+    Accepts pen samples from any thread or a local socket and hands them to
+    _on_pen_samples from the Tk thread, once per frame. Requires hooking the provided method.
+    """
+    PEN_QUEUE_SIZE = 4096       # queued move samples above which new ones are dropped
+    PEN_QUEUE_HARD_SIZE = 8192  # queued samples above which any new one is dropped
+    PEN_DRAIN_MAX = 1024        # max samples fed to the state machine per frame
+    PEN_FRAME_INTERVAL = 16     # ms between drains
+
+    _pen_lock: Optional[threading.Lock] = None
+    _pen_queue: Deque[PenSample]
+    _pen_received: int = 0
+    _pen_dropped: int = 0
+    _pen_drained: int = 0
+    _pen_frames: int = 0
+    _pen_drain_id: Optional[str] = None
+    _pen_server: Optional[socket.socket] = None
+    _pen_conn: Optional[socket.socket] = None
+
+    @property
+    def pen_stats(self) -> PenStats:
+        """Pen input counters since pen input was started."""
+        queued = len(self._pen_queue) if self._pen_lock is not None else 0
+        return PenStats(
+            self._pen_received, self._pen_dropped, self._pen_drained, queued, self._pen_frames
+        )
+
+    def start_pen_input(self) -> None:
+        """Start accepting pen samples."""
+        if self._pen_lock is not None:
+            return
+
+        self._pen_queue = deque()
+        self._pen_received = self._pen_dropped = self._pen_drained = self._pen_frames = 0
+        self._pen_lock = threading.Lock()
+        self._pen_drain_id = self.after(self.PEN_FRAME_INTERVAL, self._drain_pen)
+
+    def stop_pen_input(self) -> None:
+        """Stop accepting pen samples and close the pen server, if running."""
+        # shutdown() wakes up the server thread, blocked in accept() or recv()
+        for sock in (self._pen_server, self._pen_conn):
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        self._pen_server = None
+        self._pen_conn = None
+        if self._pen_drain_id is not None:
+            self.after_cancel(self._pen_drain_id)
+            self._pen_drain_id = None
+        self._pen_lock = None
+
+    def start_pen_server(self, port: int, host: str='127.0.0.1') -> None:
+        """Accept pen samples sent by a local process over TCP, in the pen server wire format."""
+        self.start_pen_input()
+        if self._pen_server is not None:
+            return
+
+        self._pen_server = socket.create_server((host, port))
+        threading.Thread(target=self._serve_pen, args=(self._pen_server,), daemon=True).start()
+
+    def submit_pen_samples(self, samples: Iterable[PenSample]) -> int:
+        """
+        Queue pen samples to be drawn. Safe to call from any thread.
+        Returns the number of samples accepted. When the queue is full, move samples are dropped,
+        while down and up samples are still accepted, up to a hard limit, so strokes stay whole.
+        """
+        lock = self._pen_lock
+        if lock is None:
+            return 0
+
+        received = accepted = 0
+        with lock:
+            queue = self._pen_queue
+            for sample in samples:
+                received += 1
+                is_move = sample.kind == PEN_MOVE
+                if len(queue) >= (self.PEN_QUEUE_SIZE if is_move else self.PEN_QUEUE_HARD_SIZE):
+                    continue
+                queue.append(sample)
+                accepted += 1
+            self._pen_received += received
+            self._pen_dropped += received - accepted
+        return accepted
+
+    def destroy(self) -> None:
+        """Stop pen input before destroying the canvas."""
+        self.stop_pen_input()
+        super().destroy()
+
+    def _drain_pen(self) -> None:
+        lock = self._pen_lock
+        if lock is None:
+            return
+
+        with lock:
+            queue = self._pen_queue
+            batch = [queue.popleft() for _ in range(min(len(queue), self.PEN_DRAIN_MAX))]
+
+        if batch:
+            self._on_pen_samples(batch)
+            self._pen_drained += len(batch)
+            self._pen_frames += 1
+        self._pen_drain_id = self.after(self.PEN_FRAME_INTERVAL, self._drain_pen)
+
+    def _on_pen_samples(self, samples: List[PenSample]) -> None:
+        """Invoked with the samples drained each frame. Override to feed them to the input."""
+
+    def _serve_pen(self, server: socket.socket) -> None:
+        """Pen server thread. Serves one connection at a time until the server is closed."""
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+
+            with conn:
+                self._pen_conn = conn
+                try:
+                    self._read_pen_connection(conn)
+                except OSError:
+                    pass
+                self._pen_conn = None
+
+    def _read_pen_connection(self, conn: socket.socket) -> None:
+        """Submit samples from a connection until it closes."""
+        size = PEN_SAMPLE_STRUCT.size
+        buf = b''
+        while True:
+            # Backpressure: stop reading while the queue is full, so TCP flow control
+            # blocks the sender instead of samples being dropped
+            while self._pen_lock is not None and len(self._pen_queue) >= self.PEN_QUEUE_SIZE:
+                time.sleep(self.PEN_FRAME_INTERVAL / 1000)
+            if self._pen_lock is None:
+                return
+
+            # Never read more samples than there is room for
+            room = self.PEN_QUEUE_SIZE - len(self._pen_queue)
+            data = conn.recv(max(min(room, 64) * size - len(buf), 1))
+            if not data:
+                return
+            buf += data
+            n = len(buf) - len(buf) % size
+            self.submit_pen_samples(decode_pen_samples(buf[:n]))
+            buf = buf[n:]
@@ -0,0 +1,287 @@
+"""
+Cached raster layers for committed strokes on the SDCanvas class.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import tkinter as tk
+
+from sdcanvas import STYLES
+from sdcanvas.mixins.bg import BGMixin
+from sdcanvas.mixins.draw import DrawMixin
+
+# concurrent.futures and PIL are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from PIL.Image import Image as PILImage
+    from PIL.ImageTk import PhotoImage as PILPhotoImage
+    from PIL.ImageDraw import ImageDraw as PILImageDraw
+
+Region = Tuple[int, int]
+Stroke = Tuple[str, List[float]]
+RGB = Tuple[int, int, int]
+
+class RasterMixin(BGMixin, DrawMixin, tk.Canvas):  # pylint: disable=too-many-instance-attributes
+    """
+    Bakes committed items into region-sized images aligned with the background tile grid.
+
+    Baked items are kept on the canvas as hidden vector items, so saving, undoing and re-baking
+    keep working from the original vector data while Tk only draws one image per region.
+    """
+    RASTER_TAG = 'raster'
+    REGION_TILES = 8            # region side length, in background tiles
+    DEFAULT_REGION_SIZE = 512   # region side length when there is no background
+    LIVE_ITEMS = 32             # most recent items are never baked
+    BAKE_DELAY = 500            # ms without new items before baking
+    POLL_INTERVAL = 16          # ms between checks for finished bakes
+
+    _raster_executor: Optional[ThreadPoolExecutor] = None
+    _raster_bake_id: Optional[str] = None
+    _raster_poll_id: Optional[str] = None
+    _region_size: Tuple[int, int] = 0, 0
+    _line_rgb: RGB = 0, 0, 0
+    _oval_rgb: RGB = 0, 0, 0
+
+    # Baking state, created by enable_raster_cache
+    _item_regions: Dict[int, Set[Region]]
+    _region_items: Dict[Region, Set[int]]
+    _region_layers: Dict[Region, Tuple[int, PILPhotoImage]]
+    _region_gen: Dict[Region, int]
+    _dirty_regions: Set[Region]
+    _failed_regions: Set[Region]
+    _pending_bakes: Dict[Region, Tuple[int, Set[int], Future[PILImage]]]
+
+    @property
+    def has_raster_cache(self) -> bool:
+        """Return True if committed items are being baked into raster layers."""
+        return self._raster_executor is not None
+
+    @property
+    def has_pending_bakes(self) -> bool:
+        """Return True if baking is scheduled or in progress."""
+        return self._raster_executor is not None and (
+            self._raster_bake_id is not None or bool(self._dirty_regions or self._pending_bakes)
+        )
+
+    def enable_raster_cache(self) -> None:
+        """Start baking committed items into raster layers."""
+        if self._raster_executor is not None:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        tile_w, tile_h = self.tile_size
+        self._region_size = (
+            tile_w * self.REGION_TILES if tile_w > 0 else self.DEFAULT_REGION_SIZE,
+            tile_h * self.REGION_TILES if tile_h > 0 else self.DEFAULT_REGION_SIZE,
+        )
+        # Resolve colors through Tk so baked items look exactly like live ones
+        self._line_rgb = self._tk_rgb(STYLES.LINE['fill'])
+        self._oval_rgb = self._tk_rgb(STYLES.OVAL['fill'])
+
+        self._item_regions = {}
+        self._region_items = {}
+        self._region_layers = {}
+        self._region_gen = {}
+        self._dirty_regions = set()
+        self._failed_regions = set()
+        self._pending_bakes = {}
+        self._raster_executor = ThreadPoolExecutor(max_workers=1)
+        self._schedule_bake()
+
+    def disable_raster_cache(self) -> None:
+        """Stop baking and turn every baked item back into a live vector item."""
+        if self._raster_executor is None:
+            return
+
+        for after_id in (self._raster_bake_id, self._raster_poll_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._raster_bake_id = None
+        self._raster_poll_id = None
+        self._raster_executor.shutdown(wait=False, cancel_futures=True)
+        self._raster_executor = None
+
+        for item_id in self._item_regions:
+            self.itemconfig(item_id, state='normal')
+        self.delete(self.RASTER_TAG)
+        self._item_regions.clear()
+        self._region_items.clear()
+        self._region_layers.clear()
+        self._region_gen.clear()
+        self._dirty_regions.clear()
+        self._failed_regions.clear()
+        self._pending_bakes.clear()
+
+    def destroy(self) -> None:
+        """Stop the background worker before destroying the canvas."""
+        self.disable_raster_cache()
+        super().destroy()
+
+    def _commit_item(self, item_id: int) -> None:
+        super()._commit_item(item_id)
+        self._schedule_bake()
+
+    def remove_last_item(self):
+        """Remove the last created item from the canvas, re-baking its regions if needed."""
+        if self._raster_executor is not None and self.items:
+            regions = self._item_regions.pop(self.items[-1], set())
+            for region in regions:
+                self._region_items[region].discard(self.items[-1])
+                self._mark_region_dirty(region)
+        super().remove_last_item()
+        if self._raster_executor is not None:
+            self._submit_bakes()
+
+    def _schedule_bake(self) -> None:
+        """(Re)start the countdown to the next bake."""
+        if self._raster_executor is None:
+            return
+
+        if self._raster_bake_id is not None:
+            self.after_cancel(self._raster_bake_id)
+        self._raster_bake_id = self.after(self.BAKE_DELAY, self._bake)
+
+    def _bake(self) -> None:
+        """Assign old enough items to regions and bake every region that changed."""
+        self._raster_bake_id = None
+        for item_id in self.items[:max(len(self.items) - self.LIVE_ITEMS, 0)]:
+            if item_id in self._item_regions:
+                continue
+            bbox = self.bbox(item_id)
+            if not bbox:
+                continue
+            regions = self._get_regions(*bbox)
+            self._item_regions[item_id] = regions
+            for region in regions:
+                self._region_items.setdefault(region, set()).add(item_id)
+                self._mark_region_dirty(region)
+        self._submit_bakes()
+
+    def _get_regions(self, x1: int, y1: int, x2: int, y2: int) -> Set[Region]:
+        """Regions overlapped by the given bounding box."""
+        w, h = self._region_size
+        return {
+            (rx, ry)
+            for rx in range(x1 // w, x2 // w + 1)
+            for ry in range(y1 // h, y2 // h + 1)
+        }
+
+    def _mark_region_dirty(self, region: Region) -> None:
+        """Invalidate the layer of a region, and any bake of it still in progress."""
+        self._region_gen[region] = self._region_gen.get(region, 0) + 1
+        self._dirty_regions.add(region)
+        self._failed_regions.discard(region)
+
+    def _submit_bakes(self) -> None:
+        """Send dirty regions to the background worker, one bake per region at a time."""
+        if self._raster_executor is None:
+            return
+
+        for region in list(self._dirty_regions - self._pending_bakes.keys()):
+            self._dirty_regions.discard(region)
+            items = set(self._region_items.get(region, ()))
+            strokes: List[Stroke] = [(str(self.type(i)), self.coords(i)) for i in items]
+            w, h = self._region_size
+            future = self._raster_executor.submit(
+                _rasterize, (w, h), (region[0] * w, region[1] * h), strokes,
+                self._line_rgb, self._oval_rgb,
+            )
+            self._pending_bakes[region] = self._region_gen[region], items, future
+
+        if self._pending_bakes and self._raster_poll_id is None:
+            self._raster_poll_id = self.after(self.POLL_INTERVAL, self._poll_bakes)
+
+    def _poll_bakes(self) -> None:
+        """Show finished bakes and hide the vector items they replace."""
+        self._raster_poll_id = None
+        baked: Set[int] = set()
+        for region, (gen, items, future) in list(self._pending_bakes.items()):
+            if not future.done():
+                continue
+            del self._pending_bakes[region]
+            # Drop stale results, the region is dirty again and will be resubmitted
+            if gen != self._region_gen[region] or future.cancelled():
+                continue
+            if future.exception() is not None:
+                self._fail_region(region)
+                continue
+            self._show_region_layer(region, future.result() if items else None)
+            baked |= items
+
+        unbaked = self._dirty_regions | self._pending_bakes.keys() | self._failed_regions
+        for item_id in baked:
+            regions = self._item_regions.get(item_id)
+            if regions is None or not regions.isdisjoint(unbaked):
+                continue
+            self.itemconfig(item_id, state='hidden')
+
+        self._submit_bakes()
+
+    def _fail_region(self, region: Region) -> None:
+        """Keep the items of a region that could not be baked as live vector items."""
+        self._failed_regions.add(region)
+        if region in self._region_layers:
+            image_id, _ = self._region_layers.pop(region)
+            self.delete(image_id)
+        for item_id in self._region_items.get(region, ()):
+            self.itemconfig(item_id, state='normal')
+
+    def _show_region_layer(self, region: Region, img: Optional[PILImage]) -> None:
+        """Replace the image displayed for a region. Empty regions get no image."""
+        if region in self._region_layers:
+            image_id, _ = self._region_layers.pop(region)
+            self.delete(image_id)
+        if img is None:
+            self._region_items.pop(region, None)
+            return
+
+        from PIL.ImageTk import PhotoImage as PILPhotoImage
+
+        w, h = self._region_size
+        photoimg = PILPhotoImage(img)
+        image_id = self.create_image(
+            region[0] * w, region[1] * h, image=photoimg, anchor='nw', tags=self.RASTER_TAG
+        )
+        # Layers go right above the background, below every live item
+        self.tag_lower(image_id)
+        if self.has_background:
+            self.tag_raise(image_id, self.TAG)
+        self._region_layers[region] = image_id, photoimg
+
+    def _tk_rgb(self, color: str) -> RGB:
+        r, g, b = (v >> 8 for v in self.winfo_rgb(color))
+        return r, g, b
+
+def _rasterize(
+    size: Tuple[int, int],
+    origin: Tuple[int, int],
+    strokes: Sequence[Stroke],
+    line_rgb: RGB,
+    oval_rgb: RGB,
+) -> PILImage:
+    """Draw strokes on a transparent image. Runs on the background worker."""
+    import PIL.Image
+    import PIL.ImageDraw
+
+    img = PIL.Image.new('RGBA', size, (0, 0, 0, 0))
+    draw = PIL.ImageDraw.Draw(img)
+    ox, oy = origin
+
+    for item_type, coords in strokes:
+        points = [(x - ox, y - oy) for x, y in zip(coords[::2], coords[1::2])]
+        if item_type == 'oval':
+            draw.ellipse([*points[0], *points[1]], fill=oval_rgb)
+        elif item_type == 'line':
+            _draw_line(draw, points, line_rgb)
+
+    return img
+
+def _draw_line(draw: PILImageDraw, points: List[Tuple[float, float]], rgb: RGB) -> None:
+    """Draw a line with round caps, like Tk does with the LINE style."""
+    width = int(float(STYLES.LINE['width']))
+    r = width / 2
+    draw.line(points, fill=rgb, width=width, joint='curve')
+    for x, y in (points[0], points[-1]):
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=rgb)
@@ -1,20 +1,28 @@
 """
 Save and load the contents of the SDCanvas to an svg file.
 """
-from typing import Any, List, Literal, Tuple
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from typing import Any, Callable, List, Literal, Optional, Tuple
 
 import base64
+from bisect import bisect_left, insort
 from itertools import chain
-from xml.etree import ElementTree
-
-from svg import (
-    Circle, Defs, Element, Image, Length, Pattern,
-    Polyline, PreserveAspectRatio, Rect, Style, SVG
-)
+import math
+import time
+import tkinter as tk
 
 from sdcanvas import STYLES
 from sdcanvas.mixins import BGMixin, DrawMixin, AreaMixin
 
+# svg and xml.etree are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    from xml.etree.ElementTree import Element as XMLElement
+    from svg import Circle, Defs, Element, Polyline
+
+    # Document index, loader and element of an item waiting to be loaded
+    PendingItem = Tuple[int, Callable[[XMLElement], None], XMLElement]
+
 # TODO: save in git friendly svg file
 
 SVG_STYLE = "".join(f"""
@@ -31,9 +39,18 @@ SVG_STYLE = "".join(f"""
 
 class SVGMixin(BGMixin, DrawMixin, AreaMixin):
     """Handle saving and loading to svg files"""
+    LOAD_SLICE = 8  # ms of item creation per event loop pass when loading progressively
+
+    document: Optional[str] = None
+
+    _load_id: Optional[str] = None
+    _load_base: int = 0             # position in items of the first loaded item
+    _load_indices: List[int] = []   # document index of every loaded item, sorted
 
     def save(self, file: str) -> None:
         """Save canvas items to an svg file."""
+        from svg import Defs, Style, SVG
+
         x, y, w, h = self._get_adjusted_active_area_xywh()
 
         def_element = Defs(elements=[Style(text=SVG_STYLE)])
@@ -46,19 +63,113 @@ class SVGMixin(BGMixin, DrawMixin, AreaMixin):
         lines = (self._save_line(i, x, y) for i in items if self._get_item_type(i) == 'line')
         elements += list(chain(ovals, lines))
 
-        svg = SVG(width=w, height=h, elements=elements)
-
         with open(file, 'w', encoding='utf-8') as f:
-            f.write(str(svg))
+            f.write(str(SVG(width=w, height=h, elements=elements)))
+        self.document = file
 
     def load(self, file: str) -> None:
         """Load canvas items from svg file."""
-        svg = ElementTree.parse(file).getroot()
-        ns = {"svg": "http://www.w3.org/2000/svg"}
-        for oval in svg.findall('.//svg:circle', ns):
+        ovals, lines = self._read_svg(file)
+        for oval in ovals:
             self._load_oval(oval)
-        for line in svg.findall('.//svg:polyline', ns):
+        for line in lines:
             self._load_line(line)
+        self.document = file
+
+    def load_progressive(self, file: str, on_done: Optional[Callable[[], None]]=None) -> None:
+        """
+        Load canvas items from svg file in time-sliced batches, starting with the items closest to
+        the view, so the canvas stays responsive. Calls on_done, if given, when finished.
+        Items keep document order, before any item drawn while loading.
+        """
+        self.cancel_load()
+
+        pending = self._get_load_queue(file)
+        self._load_base = len(self.items)
+        self._load_indices = []
+        self.document = file
+        self._load_id = self.after_idle(self._load_slice, pending, on_done)
+
+    def cancel_load(self) -> None:
+        """Stop a progressive load in progress. Already loaded items are kept."""
+        if self._load_id is not None:
+            self.after_cancel(self._load_id)
+            self._load_id = None
+
+    def _get_load_queue(self, file: str) -> List[PendingItem]:
+        """Items in the svg file, in load order. Items closest to the view are last."""
+        ovals, lines = self._read_svg(file)
+        first_points = [self._get_first_point(e) for e in chain(ovals, lines)]
+        pending: List[PendingItem] = [(i, self._load_oval, e) for i, e in enumerate(ovals)]
+        pending += [(i, self._load_line, e) for i, e in enumerate(lines, len(ovals))]
+
+        cx, cy = self.view_x + self.view_w / 2, self.view_y + self.view_h / 2
+        def distance(p: PendingItem) -> float:
+            point = first_points[p[0]]
+            if point is None:
+                # Malformed items go last, they are skipped when loaded
+                return math.inf
+            x, y = point
+            return (x - cx) ** 2 + (y - cy) ** 2
+        pending.sort(key=distance, reverse=True)
+        return pending
+
+    def _load_slice(
+        self,
+        pending: List[PendingItem],
+        on_done: Optional[Callable[[], None]],
+    ) -> None:
+        try:
+            self._load_items(pending)
+        except Exception:
+            # Still finish the load, so nothing waiting for it is left hanging
+            self._load_id = None
+            if on_done is not None:
+                on_done()
+            raise
+
+        if pending:
+            # Wait 1ms instead of 0 so idle tasks (redraws) are not starved
+            self._load_id = self.after(1, self._load_slice, pending, on_done)
+            return
+
+        self._load_id = None
+        if on_done is not None:
+            on_done()
+
+    def _load_items(self, pending: List[PendingItem]) -> None:
+        """Load pending items until the time slice runs out, keeping document order in items."""
+        deadline = time.perf_counter() + self.LOAD_SLICE / 1000
+        while pending and time.perf_counter() < deadline:
+            index, load, e = pending.pop()
+            try:
+                load(e)
+            except (KeyError, TypeError, ValueError, tk.TclError):
+                # Skip malformed items instead of stopping the whole load
+                continue
+
+            # Move the new item to its place in document order
+            item_id = self.items.pop()
+            pos = min(self._load_base + bisect_left(self._load_indices, index), len(self.items))
+            insort(self._load_indices, index)
+            self.items.insert(pos, item_id)
+
+    def _get_first_point(self, e: XMLElement) -> Optional[Tuple[float, float]]:
+        """Center of a circle or first point of a polyline, or None if malformed."""
+        try:
+            if e.tag.endswith('circle'):
+                return float(e.attrib['cx']), float(e.attrib['cy'])
+            x, y = e.attrib['points'].split()[:2]
+            return float(x), float(y)
+        except (KeyError, ValueError):
+            return None
+
+    def _read_svg(self, file: str) -> Tuple[List[XMLElement], List[XMLElement]]:
+        from xml.etree import ElementTree
+
+        svg = ElementTree.parse(file).getroot()
+        ns = {"svg": "http://www.w3.org/2000/svg"}
+        return svg.findall('.//svg:circle', ns), svg.findall('.//svg:polyline', ns)
 
     def _get_adjusted_active_area_xywh(self) -> Tuple[float, float, float, float]:
         x, y = self.active_area_position
@@ -79,6 +190,8 @@ class SVGMixin(BGMixin, DrawMixin, AreaMixin):
         if not self.has_background:
             return
 
+        from svg import Image, Length, Pattern, PreserveAspectRatio, Rect
+
         img_b64 = self._img_to_base64(self.background_tile) # type: ignore
         img = Image(
             id='tile', href=img_b64, x=0, y=0, width=self.tile_w, height=self.tile_h,
@@ -109,6 +222,8 @@ class SVGMixin(BGMixin, DrawMixin, AreaMixin):
         return f"data:image/png;base64,{img}"
 
     def _save_oval(self, item_id: int, x_offset: float, y_offset: float) -> Circle:
+        from svg import Circle
+
         coords = self.coords(item_id)
         r = (coords[2] - coords[0]) / 2
         cx = (coords[0] + coords[2]) / 2 + x_offset
@@ -116,16 +231,20 @@ class SVGMixin(BGMixin, DrawMixin, AreaMixin):
         return Circle(cx=cx, cy=cy, r=r)
 
     def _save_line(self, item_id: int, x_offset: float, y_offset: float) -> Polyline:
+        from svg import Polyline
+
         points: List[Any] = list(
             v + (x_offset, y_offset)[i % 2]
             for i, v in enumerate(self.coords(item_id))
         )
         return Polyline(points=points)
 
-    def _load_oval(self, e: ElementTree.Element) -> None:
+    def _load_oval(self, e: XMLElement) -> None:
         cx, cy = (float(e.attrib[k]) for k in ('cx', 'cy'))
         self.draw_point(cx, cy)
 
-    def _load_line(self, e: ElementTree.Element) -> None:
-        points = (float(p) for p in e.attrib['points'].split())
+    def _load_line(self, e: XMLElement) -> None:
+        points = [float(p) for p in e.attrib['points'].split()]
+        if len(points) < 4 or len(points) % 2:
+            raise ValueError(f'Invalid polyline points: {e.attrib["points"]}')
         self.draw_line(*points)
@@ -3,15 +3,30 @@ Viewport position tracking for the SDCanvas class.
 """
 from typing import cast, Literal, Optional, Tuple, TypeVar
 
+from math import hypot
+import time
 import tkinter as tk
 
 ScrollAxis = TypeVar("ScrollAxis", Literal['x'], Literal['y'])
 ScrollMethod = TypeVar("ScrollMethod", Literal['scroll'], Literal['moveto'])
 ScrollUnit = TypeVar("ScrollUnit", Literal['units'], Literal['pages'])
 
-class ViewMixin(tk.Canvas):
+class ViewMixin(tk.Canvas):  # pylint: disable=too-many-instance-attributes
     """Track viewport position on the canvas."""
+    PAN_FRAME_INTERVAL = 16     # ms, minimum time between view updates while panning
+    KINETIC_FRICTION = 0.92     # fraction of kinetic pan velocity kept per frame
+    KINETIC_MIN_SPEED = 0.05    # px/ms, kinetic panning stops below this speed
+
+    kinetic_pan: bool = True
+
     _view_position: Tuple[float, float] = 0, 0
+    _pan_delta: Tuple[float, float] = 0, 0
+    _pan_flush_id: Optional[str] = None
+    _pan_last_flush: float = 0
+    _pan_kinetic: bool = False      # pending pan movement comes from kinetic panning
+    _kinetic_velocity: Tuple[float, float] = 0, 0
+    _kinetic_time: float = 0
+    _kinetic_id: Optional[str] = None
 
     @property
     def view_position(self) -> Tuple[float, float]:
@@ -60,14 +75,112 @@ class ViewMixin(tk.Canvas):
         out = super().xview(*args)
         if len(args) >= 2:
             self._update_view_position('x', *args)
+            self._on_view_changed()
         return out
 
     def yview(self, *args):
         out = super().yview(*args)
         if len(args) >= 2:
             self._update_view_position('y', *args)
+            self._on_view_changed()
         return out
 
+    def pan(self, dx: float, dy: float) -> None:
+        """
+        Move the view by dx, dy scroll units (pixels on SDCanvas).
+        Calls made within the same frame are coalesced into a single view update.
+        """
+        self._pan_delta = self._pan_delta[0] + dx, self._pan_delta[1] + dy
+        if self._pan_flush_id is not None:
+            return
+
+        wait = self.PAN_FRAME_INTERVAL - (time.perf_counter() - self._pan_last_flush) * 1000
+        if wait <= 0:
+            self._flush_pan()
+        else:
+            self._pan_flush_id = self.after(int(wait), self._flush_pan)
+
+    def flush_pan(self) -> None:
+        """Apply pending pan movement now instead of waiting for the next frame."""
+        if self._pan_flush_id is not None:
+            self.after_cancel(self._pan_flush_id)
+        self._flush_pan()
+
+    def start_kinetic_pan(self, vx: float, vy: float) -> None:
+        """Keep panning at vx, vy units per ms, slowing down until stopped. No-op if disabled."""
+        self.stop_kinetic_pan()
+        if not self.kinetic_pan or hypot(vx, vy) < self.KINETIC_MIN_SPEED:
+            return
+
+        self._kinetic_velocity = vx, vy
+        self._kinetic_time = time.perf_counter()
+        self._kinetic_id = self.after(self.PAN_FRAME_INTERVAL, self._kinetic_step)
+
+    def stop_kinetic_pan(self) -> None:
+        """Stop kinetic panning, if running."""
+        if self._kinetic_id is None:
+            return
+
+        self.after_cancel(self._kinetic_id)
+        self._kinetic_id = None
+        self._settle_kinetic_pan()
+
+    def _settle_kinetic_pan(self) -> None:
+        """
+        Apply pending kinetic movement and drop what is left of a unit, so following pans
+        scroll exactly the units they are given.
+        """
+        self.flush_pan()
+        self._pan_delta = 0, 0
+
+    def _flush_pan(self) -> None:
+        self._pan_flush_id = None
+        self._pan_last_flush = time.perf_counter()
+        kinetic = self._pan_kinetic
+        self._pan_kinetic = False
+
+        # Only scroll whole units, keep the remainder for the next frame
+        dx, dy = self._pan_delta
+        ix, iy = int(dx), int(dy)
+        self._pan_delta = dx - ix, dy - iy
+        if ix == 0 and iy == 0:
+            return
+
+        if ix != 0:
+            self.xview_scroll(ix, 'units')
+            self._update_view_position('x', 'scroll', str(ix), 'units')
+        if iy != 0:
+            self.yview_scroll(iy, 'units')
+            self._update_view_position('y', 'scroll', str(iy), 'units')
+        if kinetic:
+            self._on_kinetic_pan(ix, iy)
+        self._on_view_changed()
+
+    def _kinetic_step(self) -> None:
+        now = time.perf_counter()
+        dt = (now - self._kinetic_time) * 1000
+        self._kinetic_time = now
+
+        vx, vy = self._kinetic_velocity
+        self._pan_kinetic = True
+        self.pan(vx * dt, vy * dt)
+
+        decay = self.KINETIC_FRICTION ** (dt / self.PAN_FRAME_INTERVAL)
+        vx, vy = vx * decay, vy * decay
+        if hypot(vx, vy) < self.KINETIC_MIN_SPEED:
+            self._kinetic_id = None
+            self._settle_kinetic_pan()
+            return
+
+        self._kinetic_velocity = vx, vy
+        self._kinetic_id = self.after(self.PAN_FRAME_INTERVAL, self._kinetic_step)
+
+    def _on_kinetic_pan(self, dx: int, dy: int) -> None:
+        """Invoked with the units scrolled by each kinetic pan frame. Override to track them."""
+
+    def _on_view_changed(self) -> None:
+        """Invoked once after every view position change. Override to add functionality."""
+
     def _update_view_position(
         self,
         axis: ScrollAxis,
@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+from typing import Any, List, Optional
+
+import os
 import tkinter as tk
 
-from sdcanvas.mixins import AreaMixin, BGMixin, DrawMixin, SVGMixin, ViewMixin
+from sdcanvas.mixins import (
+    AreaMixin, BGMixin, DrawMixin, PenInputMixin, RasterMixin, SVGMixin, ViewMixin
+)
+from sdcanvas.mixins.pen import PEN_DOWN, PEN_MOVE, PEN_UP, PenEvent, PenSample
 from sdcanvas.states import init_state_machine
+from sdcanvas.trace import TraceRecorder
+
+class SDCanvas(
+    SVGMixin, RasterMixin, BGMixin, ViewMixin, DrawMixin, AreaMixin, PenInputMixin, tk.Canvas
+):
+    """
+    ScoreDraft canvas: Tk Canvas with custom functionality.
+    Heavy setup is deferred until the canvas is first shown, then the given document is loaded
+    progressively. Generates <<FirstFrame>> once first drawn and <<Ready>> when setup is done.
+    """
+    BACKGROUND_TILE = 'backgrounds/paper5_1.png'
+
+    _startup_bind_id: Optional[str] = None
+    _ready: bool = False
+    _trace: Optional[TraceRecorder] = None
+    _trace_file: Optional[str] = None
 
-class SDCanvas(SVGMixin, BGMixin, ViewMixin, DrawMixin, AreaMixin, tk.Canvas):
-    "ScoreDraft canvas: Tk Canvas with custom functionality."
-    def __init__(self, parent, **kwargs) -> None:
+    def __init__(
+        self,
+        parent,
+        raster_cache: bool=False,
+        document: Optional[str]=None,
+        **kwargs
+    ) -> None:
         super().__init__(parent, **kwargs)
 
         self.configure(
@@ -17,7 +43,9 @@ class SDCanvas(SVGMixin, BGMixin, ViewMixin, DrawMixin, AreaMixin, tk.Canvas):
             confine=False,
         )
 
-        self.set_background_tile('backgrounds/paper5_1.png')
+        self._raster_cache = raster_cache
+        self._startup_document = document
+        self._startup_bind_id = self.bind('<Expose>', self._on_first_expose, add=True)
 
         self._state = init_state_machine(self)
         self.bind('<ButtonPress-1>', self._on_rmb_press)
@@ -27,26 +55,131 @@ class SDCanvas(SVGMixin, BGMixin, ViewMixin, DrawMixin, AreaMixin, tk.Canvas):
         self.bind('<B3-Motion>', self._on_lmb_drag)
         self.bind('<ButtonRelease-3>', self._on_lmb_release)
         self.bind('<Key>', self._on_key)
+        self.bind('<Configure>', self._on_resize, add=True)
 
         self.focus_set()
 
+    def start_trace_recording(self, file: str) -> None:
+        """
+        Record input events to a trace file, to replay them later. Recording starts once the
+        canvas is ready, so the trace header holds its final size and document.
+        """
+        self.stop_trace_recording()
+        if not self._ready:
+            self._trace_file = file
+            return
+
+        document = self.document or self._startup_document
+        self._trace = TraceRecorder(file, {
+            'width': self.winfo_width(),
+            'height': self.winfo_height(),
+            'document': os.path.abspath(document) if document is not None else None,
+            'raster_cache': self.has_raster_cache,
+            'predictive_ink': self.predictive_ink,
+        })
+
+    def stop_trace_recording(self) -> None:
+        """Stop recording input events and close the trace file, if recording."""
+        self._trace_file = None
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def _on_first_expose(self, _event):
+        if self._startup_bind_id is None:
+            return
+        self.unbind('<Expose>', self._startup_bind_id)
+        self._startup_bind_id = None
+        # The canvas queued its redraw before this binding ran, so this runs after the first frame
+        self.after_idle(self._on_first_frame)
+
+    def _on_first_frame(self):
+        self.event_generate('<<FirstFrame>>')
+        self.after_idle(self._finish_startup)
+
+    def _finish_startup(self):
+        self.set_background_tile(self.BACKGROUND_TILE)
+        if self._raster_cache:
+            self.enable_raster_cache()
+
+        if self._startup_document is None:
+            self._on_ready()
+            return
+
+        try:
+            self.load_progressive(self._startup_document, self._on_ready)
+        except (OSError, SyntaxError, KeyError, ValueError):
+            # xml.etree parse errors are SyntaxErrors
+            print("Loading document failed. Ignoring.")
+            self._on_ready()
+
+    def _on_ready(self):
+        self._ready = True
+        if self._trace_file is not None:
+            self.start_trace_recording(self._trace_file)
+        self.event_generate('<<Ready>>')
+
+    def _record(self, kind: str, event: Any):
+        if self._trace is not None:
+            self._trace.record(kind, event)
+
+    def _record_batch(self, kind: str, events: List[Any]):
+        if self._trace is not None:
+            self._trace.record_batch(kind, events)
+
+    def _on_kinetic_pan(self, dx: int, dy: int) -> None:
+        if self._trace is not None:
+            self._trace.record_pan(dx, dy)
+
+    def _on_resize(self, event):
+        self._record('configure', event)
+
+    def _on_pen_samples(self, samples: List[PenSample]) -> None:
+        """Feed pen samples to the input dispatchers. Consecutive moves are sent as one batch."""
+        moves: List[PenEvent] = []
+        for s in samples:
+            event = PenEvent(int(s.x), int(s.y), s.time * 1000)
+            if s.kind == PEN_MOVE:
+                moves.append(event)
+                continue
+            if moves:
+                self._on_rmb_drag_batch(moves)
+                moves = []
+            if s.kind == PEN_DOWN:
+                self._on_rmb_press(event)
+            elif s.kind == PEN_UP:
+                self._on_rmb_release(event)
+        if moves:
+            self._on_rmb_drag_batch(moves)
+
     def _on_rmb_press(self, event):
+        self._record('rmb_press', event)
         self._state = self._state.on_rmb_press(event)
 
     def _on_rmb_drag(self, event):
+        self._record('rmb_drag', event)
         self._state = self._state.on_rmb_drag(event)
 
+    def _on_rmb_drag_batch(self, events):
+        self._record_batch('rmb_drag_batch', events)
+        self._state = self._state.on_rmb_drag_batch(events)
+
     def _on_rmb_release(self, event):
+        self._record('rmb_release', event)
         self._state = self._state.on_rmb_release(event)
 
     def _on_lmb_press(self, event):
+        self._record('lmb_press', event)
         self._state = self._state.on_lmb_press(event)
 
     def _on_lmb_drag(self, event):
+        self._record('lmb_drag', event)
         self._state = self._state.on_lmb_drag(event)
 
     def _on_lmb_release(self, event):
+        self._record('lmb_release', event)
         self._state = self._state.on_lmb_release(event)
 
     def _on_key(self, event):
+        self._record('key', event)
         self._state = self._state.on_key(event)
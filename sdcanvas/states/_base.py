@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from typing import Any, Optional, Tuple, Type
+from typing import Any, Optional, Sequence, Tuple, Type
 
 from abc import ABC
 import tkinter as tk
@@ -30,6 +30,15 @@ class SDCanvasState(ABC):
         "Override to handle right mouse button dragging."
         return self
 
+    def on_rmb_drag_batch(self, events: Sequence[tk.Event]) -> SDCanvasState:
+        "Handle many right mouse button drag events at once. Override to batch the work."
+        state: SDCanvasState = self
+        for i, event in enumerate(events):
+            state = state.on_rmb_drag(event)
+            if state is not self:
+                return state.on_rmb_drag_batch(events[i + 1:])
+        return state
+
     def on_rmb_release(self, event: tk.Event) -> SDCanvasState:
         "Override to handle right mouse button releases."
         return self
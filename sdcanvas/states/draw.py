@@ -12,7 +12,7 @@ class DrawState(State):
     def on_rmb_drag(self, event):
         from sdcanvas.states.drawline import DrawLineState
         xy = self._get_canvas_xy(event)
-        self._sdc.start_line(*self._xy, *xy)
+        self._sdc.start_line(*self._xy, *xy, time=event.time)
         return self.transition_to(DrawLineState, event)
 
     def on_rmb_release(self, event):
@@ -4,7 +4,15 @@ class DrawLineState(State):
     "User is drawing a line."
     def on_rmb_drag(self, event):
         xy = self._get_canvas_xy(event)
-        self._sdc.extend_line(*xy)
+        self._sdc.extend_line(*xy, time=event.time)
+        return self
+
+    def on_rmb_drag_batch(self, events):
+        coords = []
+        for event in events:
+            coords += self._get_canvas_xy(event)
+        if coords:
+            self._sdc.extend_line(*coords, times=[event.time for event in events])
         return self
 
     def on_rmb_release(self, event):
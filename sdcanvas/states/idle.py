@@ -4,10 +4,12 @@ class IdleState(State):
     "Waiting for input."
     def on_rmb_press(self, event):
         from sdcanvas.states.draw import DrawState
+        self._sdc.stop_kinetic_pan()
         return self.transition_to(DrawState, event)
 
     def on_lmb_press(self, event):
         from sdcanvas.states.scroll import ScrollState
+        self._sdc.stop_kinetic_pan()
         return self.transition_to(ScrollState, event)
 
     def on_key(self, event):
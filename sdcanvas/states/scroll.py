@@ -1,16 +1,25 @@
-from typing import Tuple
+from typing import Deque, Tuple
+
+from collections import deque
+from itertools import islice
 
 from sdcanvas.states import State
 
 class ScrollState(State):
     "User is scrolling the view with the mouse."
+    KINETIC_WINDOW = 100    # ms of drag history used to compute release velocity
+
     _xy: Tuple[int, int]
+    _samples: Deque[Tuple[int, int, int]]   # (time, dx, dy) of recent drag events
 
     def on_enter(self, event, data=None):
         self._xy = event.x, event.y
+        self._samples = deque()
         self._sdc.config(cursor="hand1")
 
     def on_exit(self):
+        # Following input must see the final view position
+        self._sdc.flush_pan()
         self._sdc.config(cursor="")
 
     def on_lmb_drag(self, event):
@@ -18,13 +27,28 @@ class ScrollState(State):
         x2, y2 = event.x, event.y
         x_units = x1 - x2
         y_units = y1 - y2
-        if x_units != 0:
-            self._sdc.xview('scroll', str(x_units), 'units')
-        if y_units != 0:
-            self._sdc.yview('scroll', str(y_units), 'units')
+        if x_units != 0 or y_units != 0:
+            self._sdc.pan(x_units, y_units)
+            self._add_sample(event.time, x_units, y_units)
         self._xy = x2, y2
         return self
 
     def on_lmb_release(self, event):
         from sdcanvas.states.idle import IdleState
+        self._drop_old_samples(event.time)
+        if len(self._samples) >= 2:
+            # The first sample's movement happened before its time, so only count the rest
+            dt = event.time - self._samples[0][0]
+            dx = sum(s[1] for s in islice(self._samples, 1, None))
+            dy = sum(s[2] for s in islice(self._samples, 1, None))
+            if dt > 0:
+                self._sdc.start_kinetic_pan(dx / dt, dy / dt)
         return self.transition_to(IdleState, event)
+
+    def _add_sample(self, t: int, dx: int, dy: int) -> None:
+        self._samples.append((t, dx, dy))
+        self._drop_old_samples(t)
+
+    def _drop_old_samples(self, t: int) -> None:
+        while self._samples and t - self._samples[0][0] > self.KINETIC_WINDOW:
+            self._samples.popleft()
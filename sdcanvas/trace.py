@@ -0,0 +1,152 @@
+"""
+Input trace recording for the SDCanvas class.
+
+A trace is a gzipped text file. The first line is a JSON header, each following line is an event:
+`t kind x y time keysym`, where t is ms since recording started and time is the Tk event time.
+Configure events store the new width and height as x and y, pan events the units scrolled by
+kinetic panning. A batch of drag events is stored as an `rmb_drag_batch` line with the number
+of events as x, followed by the events.
+"""
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import gzip
+import json
+import time
+import zlib
+
+TRACE_VERSION = 1
+TRACE_FLUSH_INTERVAL = 1000     # ms between flushes, bounds what a crash can lose
+
+TRACE_KINDS = (
+    'rmb_press', 'rmb_drag', 'rmb_drag_batch', 'rmb_release',
+    'lmb_press', 'lmb_drag', 'lmb_release',
+    'key', 'configure', 'pan',
+)
+
+class TraceEvent(NamedTuple):
+    """A recorded event. Has the tk.Event fields used by SDCanvas, so it can be replayed."""
+    t: float        # ms since recording started
+    kind: str
+    x: int
+    y: int
+    time: float
+    keysym: str
+
+    @property
+    def width(self) -> int:
+        """New canvas width, for configure events."""
+        return self.x
+
+    @property
+    def height(self) -> int:
+        """New canvas height, for configure events."""
+        return self.y
+
+class TraceBatch(NamedTuple):
+    """Recorded events that were dispatched together."""
+    t: float
+    kind: str
+    events: List[TraceEvent]
+
+TraceItem = Union[TraceEvent, TraceBatch]
+
+class TraceRecorder:
+    """Streams events passed to the SDCanvas input dispatchers to a trace file."""
+    def __init__(self, file: str, header: Dict[str, Any]) -> None:
+        self.file = file
+        self._t0 = time.perf_counter()
+        self._last_flush = 0.0
+        self._f: Optional[IO[str]] = gzip.open(file, 'wt', encoding='utf-8')
+        self._f.write(json.dumps({'version': TRACE_VERSION, **header}) + '\n')
+
+    def record(self, kind: str, event: Any) -> None:
+        """Record an event of the given kind."""
+        self._write(self._now(), kind, event)
+
+    def record_batch(self, kind: str, events: List[Any]) -> None:
+        """Record events dispatched together, so they can be replayed as a batch."""
+        t = self._now()
+        self._write_line(t, f'{kind} {len(events)} 0 0 ??')
+        for event in events:
+            self._write(t, 'rmb_drag', event)
+
+    def record_pan(self, dx: int, dy: int) -> None:
+        """Record units scrolled without an input event, e.g. by kinetic panning."""
+        self._write_line(self._now(), f'pan {dx} {dy} 0 ??')
+
+    def close(self) -> None:
+        """Finish writing the trace file."""
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def _write(self, t: float, kind: str, event: Any) -> None:
+        if kind == 'configure':
+            x, y = event.width, event.height
+        else:
+            x, y = event.x, event.y
+        # Tk sets fields that do not apply to an event to '??'
+        event_time = event.time if isinstance(event.time, (int, float)) else 0
+        keysym = getattr(event, 'keysym', None) or '??'
+        self._write_line(t, f'{kind} {int(x)} {int(y)} {event_time:.15g} {keysym}')
+
+    def _write_line(self, t: float, fields: str) -> None:
+        if self._f is None:
+            return
+        self._f.write(f'{t:.3f} {fields}\n')
+        if t - self._last_flush >= TRACE_FLUSH_INTERVAL:
+            self._f.flush()
+            self._last_flush = t
+
+def read_trace(file: str) -> Tuple[Dict[str, Any], List[TraceItem], int]:
+    """
+    Read a trace file. Returns its header, its events and the number of events dropped from its
+    end because they were cut short, e.g. by a crash. Raises ValueError on invalid events.
+    """
+    with open(file, 'rb') as f:
+        # Unlike gzip.open, keeps everything written before a trace was cut short
+        data = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16).decompress(f.read())
+    lines = data.split(b'\n')
+    tail = lines.pop()  # empty unless the last line is incomplete
+    if not lines:
+        raise ValueError('Trace has no header')
+
+    header = json.loads(lines[0])
+    if header.get('version') != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version: {header.get('version')}")
+
+    events: List[TraceItem] = []
+    dropped = _read_events([line.decode('utf-8') for line in lines[1:]], events)
+    if dropped == 0 and tail:
+        dropped = 1
+    return header, events, dropped
+
+def _read_events(lines: List[str], events: List[TraceItem]) -> int:
+    """Parse event lines into events. Returns the number of events of a batch cut short."""
+    i = 0
+    while i < len(lines):
+        event = _parse_event(lines, i)
+        i += 1
+        if event.kind != 'rmb_drag_batch':
+            events.append(event)
+            continue
+        if i + event.x > len(lines):
+            return event.x
+        events.append(TraceBatch(event.t, event.kind, [
+            _parse_event(lines, j) for j in range(i, i + event.x)
+        ]))
+        i += event.x
+    return 0
+
+def _parse_event(lines: List[str], i: int) -> TraceEvent:
+    try:
+        t, kind, x, y, event_time, keysym = lines[i].split()
+        if kind not in TRACE_KINDS:
+            raise ValueError(f'unknown kind {kind}')
+        return TraceEvent(float(t), kind, int(x), int(y), float(event_time), keysym)
+    except ValueError as e:
+        # Line 1 is the header
+        raise ValueError(f'Invalid trace event on line {i + 2}: {e}') from e
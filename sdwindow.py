@@ -1,3 +1,7 @@
+from typing import Optional
+
+import argparse
+import os
 from tkinter import Tk, HORIZONTAL, VERTICAL
 from tkinter import ttk
 
@@ -5,9 +9,16 @@ from sdcanvas import SDCanvas
 
 # TODO: find how to run many concurrent windows in a nonblocking manner.
 
+LAST_DOCUMENT_FILE = os.path.join(os.path.expanduser('~'), '.scoredraft_last')
+
 class SDWindow(Tk):
     """Main ScoreDraft window"""
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        document: Optional[str]=None,
+        pen_port: Optional[int]=None,
+        raster_cache: bool=False,
+    ) -> None:
         super().__init__()
         self.title('ScoreDraft')
         self.columnconfigure(0, weight=1)
@@ -18,7 +29,9 @@ class SDWindow(Tk):
         fr.grid_columnconfigure(0, weight=1)
         fr.grid_rowconfigure(0, weight=1)
 
-        sp = SDCanvas(fr, scrollregion=(0, 0, 400, 400))
+        sp = SDCanvas(
+            fr, raster_cache=raster_cache, document=document, scrollregion=(0, 0, 400, 400)
+        )
         sx = ttk.Scrollbar(fr, orient=HORIZONTAL, command=sp.xview)
         sy = ttk.Scrollbar(fr, orient=VERTICAL, command=sp.yview)
         sp.configure(xscrollcommand=sx.set, yscrollcommand=sy.set)
@@ -27,6 +40,52 @@ class SDWindow(Tk):
         sx.grid(column=0, row=1, sticky='we')
         sy.grid(column=1, row=0, sticky='ns')
 
+        self.show_pen_stats = False
+        if pen_port is not None:
+            sp.start_pen_server(pen_port)
+
+        self.canvas = sp
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+    def _on_close(self) -> None:
+        """Remember the open document so it is restored on next launch."""
+        if self.canvas.document is not None:
+            try:
+                with open(LAST_DOCUMENT_FILE, 'w', encoding='utf-8') as f:
+                    f.write(os.path.abspath(self.canvas.document))
+            except OSError:
+                print("Saving last document failed. Ignoring.")
+        if self.show_pen_stats:
+            print(self.canvas.pen_stats)
+        self.canvas.stop_trace_recording()
+        self.destroy()
+
+def get_last_document() -> Optional[str]:
+    """Return the document open when ScoreDraft was last closed, if it still exists."""
+    try:
+        with open(LAST_DOCUMENT_FILE, encoding='utf-8') as f:
+            document = f.read().strip()
+    except OSError:
+        return None
+    return document if os.path.isfile(document) else None
+
 if __name__ == "__main__":
-    sd = SDWindow()
-    sd.mainloop()
+    parser = argparse.ArgumentParser(description='ScoreDraft')
+    parser.add_argument('document', nargs='?', help='svg document to open')
+    parser.add_argument('--pen-port', type=int, help='accept pen input on this local port')
+    parser.add_argument('--pen-stats', action='store_true', help='print pen input stats on exit')
+    parser.add_argument('--predictive-ink', action='store_true', help='draw ink ahead of the pen')
+    parser.add_argument('--raster-cache', action='store_true', help='bake strokes into layers')
+    parser.add_argument('--record', metavar='TRACE', help='record input to a trace file for replay')
+    args = parser.parse_args()
+
+    sd = SDWindow(args.document or get_last_document(), args.pen_port, args.raster_cache)
+    sd.canvas.predictive_ink = args.predictive_ink
+    sd.show_pen_stats = args.pen_stats
+    if args.record is not None:
+        sd.canvas.start_trace_recording(args.record)
+    try:
+        sd.mainloop()
+    finally:
+        # Also close the trace on Ctrl-C
+        sd.canvas.stop_trace_recording()